@@ -6,8 +6,10 @@ algorithmic stablecoin systems under various shock scenarios.
 """
 
 from .collateral_shock import (
+    STATE_DTYPE,
     ExperimentResults,
     run_collateral_shock_experiment,
+    ResultsPlotter,
     plot_results,
 )
 from .liquidity_crisis import run_liquidity_crisis_experiment
@@ -18,8 +20,10 @@ from .monte_carlo import (
 
 __all__ = [
     # Collateral shock
+    "STATE_DTYPE",
     "ExperimentResults",
     "run_collateral_shock_experiment",
+    "ResultsPlotter",
     "plot_results",
     # Liquidity crisis
     "run_liquidity_crisis_experiment",
@@ -2,19 +2,25 @@ import numpy as np
 import matplotlib.pyplot as plt
 from dataclasses import dataclass
 from typing import List, Tuple
-from model.dynamics import simulate_step
+from model.dynamics import _run_trajectory
 from model.parameters import SystemParameters
 import os
 
+# Record layout of one time step; matches the column order of simulate_trajectory
+STATE_DTYPE = np.dtype([
+    ('supply', np.float32),
+    ('price', np.float32),
+    ('collateral', np.float32),
+    ('liquidity', np.float32),
+    ('demand', np.float32),
+])
+
 @dataclass
 class ExperimentResults:
     """Results from a collateral shock experiment."""
     time: np.ndarray
-    supply: np.ndarray
-    price: np.ndarray
-    collateral: np.ndarray
-    liquidity: np.ndarray
-    demand: np.ndarray
+    # Record array with STATE_DTYPE fields, one record per time step
+    trajectory: np.ndarray
     
     # Metrics
     peg_deviation_integral: float
@@ -22,6 +28,27 @@ class ExperimentResults:
     max_drawdown: float
     recovered: bool
     
+    # Zero-copy views of the individual time series
+    @property
+    def supply(self) -> np.ndarray:
+        return self.trajectory['supply']
+    
+    @property
+    def price(self) -> np.ndarray:
+        return self.trajectory['price']
+    
+    @property
+    def collateral(self) -> np.ndarray:
+        return self.trajectory['collateral']
+    
+    @property
+    def liquidity(self) -> np.ndarray:
+        return self.trajectory['liquidity']
+    
+    @property
+    def demand(self) -> np.ndarray:
+        return self.trajectory['demand']
+
 def run_collateral_shock_experiment(
     shock_magnitude: float,
     shock_time: int,
@@ -40,128 +67,124 @@ def run_collateral_shock_experiment(
     Returns:
         ExperimentResults with time series and metrics
     """
-    # Initialize state
-    S = params.initial_supply
-    P = params.initial_price
-    C = params.initial_collateral
-    L = params.initial_liquidity
-    D = params.initial_demand
-    
-    # Storage
     time = np.arange(n_steps) * params.dt
-    supply = np.zeros(n_steps)
-    price = np.zeros(n_steps)
-    collateral = np.zeros(n_steps)
-    liquidity = np.zeros(n_steps)
-    demand = np.zeros(n_steps)
     
     # Set random seed
     np.random.seed(params.random_seed)
     
     # Simulate
-    for t in range(n_steps):
-        # Apply shock at specified time
-        c_shock = shock_magnitude if t == shock_time else 0.0
-        
-        # Store state
-        supply[t] = S
-        price[t] = P
-        collateral[t] = C
-        liquidity[t] = L
-        demand[t] = D
-        
-        # Step forward
-        S, P, C, L, D = simulate_step(
-            (S, P, C, L, D),
-            params,
-            collateral_shock=c_shock
-        )
-    
-    # Compute metrics
-    peg_deviation = np.trapezoid(np.abs(price - 1.0), time)
-    
-    collapse_mask = price < params.collapse_price_threshold
-    if np.any(collapse_mask):
-        time_to_collapse = time[np.argmax(collapse_mask)]
-    else:
-        time_to_collapse = np.inf
-    
-    max_drawdown = np.max(1.0 - price)
-    
-    # Check recovery
-    if time_to_collapse < np.inf:
-        post_collapse = price[collapse_mask]
-        recovered = np.any(post_collapse > params.recovery_price_threshold)
-    else:
-        recovered = True
+    trajectory, peg_deviation, collapse_idx, max_drawdown, recovered = _run_trajectory(
+        params,
+        n_steps,
+        shock_time=shock_time,
+        collateral_shock=shock_magnitude
+    )
+    time_to_collapse = collapse_idx * params.dt if collapse_idx >= 0 else np.inf
     
     return ExperimentResults(
         time=time,
-        supply=supply,
-        price=price,
-        collateral=collateral,
-        liquidity=liquidity,
-        demand=demand,
+        trajectory=trajectory.view(STATE_DTYPE)[:, 0],
         peg_deviation_integral=peg_deviation,
         time_to_collapse=time_to_collapse,
         max_drawdown=max_drawdown,
         recovered=recovered
     )
 
+class ResultsPlotter:
+    """
+    Reusable 2x2 figure for plotting experiment results.
+    
+    The figure, axes and line artists are built once; each ``plot`` call
+    only swaps in the new data, so sweep drivers can render many results
+    without rebuilding the figure every time.
+    """
+    
+    def __init__(self):
+        self.fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+        
+        # Price
+        self.price_line, = axes[0, 0].plot([], [], 'b-', linewidth=2)
+        axes[0, 0].axhline(y=1.0, color='k', linestyle='--', label='Peg')
+        axes[0, 0].axhline(y=0.5, color='r', linestyle='--', label='Collapse')
+        axes[0, 0].set_xlabel('Time')
+        axes[0, 0].set_ylabel('Price')
+        axes[0, 0].set_title('Stablecoin Price')
+        axes[0, 0].grid(True, alpha=0.3)
+        axes[0, 0].legend()
+        
+        # Supply
+        self.supply_line, = axes[0, 1].plot([], [], 'g-', linewidth=2)
+        axes[0, 1].set_xlabel('Time')
+        axes[0, 1].set_ylabel('Supply')
+        axes[0, 1].set_title('Stablecoin Supply')
+        axes[0, 1].grid(True, alpha=0.3)
+        
+        # Collateral & Liquidity
+        ax1 = axes[1, 0]
+        ax2 = ax1.twinx()
+        self.collateral_line, = ax1.plot([], [], 'r-', linewidth=2, label='Collateral')
+        self.liquidity_line, = ax2.plot([], [], 'b-', linewidth=2, label='Liquidity')
+        ax1.set_xlabel('Time')
+        ax1.set_ylabel('Collateral', color='r')
+        ax2.set_ylabel('Liquidity', color='b')
+        ax1.tick_params(axis='y', labelcolor='r')
+        ax2.tick_params(axis='y', labelcolor='b')
+        axes[1, 0].set_title('Collateral & Liquidity')
+        axes[1, 0].grid(True, alpha=0.3)
+        
+        # Demand
+        self.demand_line, = axes[1, 1].plot([], [], 'm-', linewidth=2)
+        axes[1, 1].set_xlabel('Time')
+        axes[1, 1].set_ylabel('Demand')
+        axes[1, 1].set_title('Aggregate Demand')
+        axes[1, 1].grid(True, alpha=0.3)
+        
+        self.axes = [axes[0, 0], axes[0, 1], ax1, ax2, axes[1, 1]]
+    
+    def plot(self, results: ExperimentResults, save_path: str = None, dpi: int = 300):
+        """
+        Plot experiment results on the reused figure.
+        
+        Args:
+            results: ExperimentResults object
+            save_path: Optional path to save figure
+            dpi: Resolution of the saved figure
+        """
+        self.price_line.set_data(results.time, results.price)
+        self.supply_line.set_data(results.time, results.supply)
+        self.collateral_line.set_data(results.time, results.collateral)
+        self.liquidity_line.set_data(results.time, results.liquidity)
+        self.demand_line.set_data(results.time, results.demand)
+        
+        for ax in self.axes:
+            ax.relim()
+            ax.autoscale_view()
+        
+        # Tick label widths depend on the data, so lay out again
+        self.fig.tight_layout()
+        
+        if save_path:
+            # Ensure directory exists
+            os.makedirs(os.path.dirname(save_path), exist_ok=True)
+            self.fig.savefig(save_path, dpi=dpi, bbox_inches='tight')
+            print(f"Plot saved to {save_path}")
+    
+    def close(self):
+        """Release the underlying figure."""
+        plt.close(self.fig)
+
 def plot_results(results: ExperimentResults, save_path: str = None):
     """
     Plot experiment results.
     
+    Creates a new figure per call; use ``ResultsPlotter`` directly to reuse
+    one figure across many results.
+    
     Args:
         results: ExperimentResults object
         save_path: Optional path to save figure
     """
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
-    
-    # Price
-    axes[0, 0].plot(results.time, results.price, 'b-', linewidth=2)
-    axes[0, 0].axhline(y=1.0, color='k', linestyle='--', label='Peg')
-    axes[0, 0].axhline(y=0.5, color='r', linestyle='--', label='Collapse')
-    axes[0, 0].set_xlabel('Time')
-    axes[0, 0].set_ylabel('Price')
-    axes[0, 0].set_title('Stablecoin Price')
-    axes[0, 0].grid(True, alpha=0.3)
-    axes[0, 0].legend()
-    
-    # Supply
-    axes[0, 1].plot(results.time, results.supply, 'g-', linewidth=2)
-    axes[0, 1].set_xlabel('Time')
-    axes[0, 1].set_ylabel('Supply')
-    axes[0, 1].set_title('Stablecoin Supply')
-    axes[0, 1].grid(True, alpha=0.3)
-    
-    # Collateral & Liquidity
-    ax1 = axes[1, 0]
-    ax2 = ax1.twinx()
-    ax1.plot(results.time, results.collateral, 'r-', linewidth=2, label='Collateral')
-    ax2.plot(results.time, results.liquidity, 'b-', linewidth=2, label='Liquidity')
-    ax1.set_xlabel('Time')
-    ax1.set_ylabel('Collateral', color='r')
-    ax2.set_ylabel('Liquidity', color='b')
-    ax1.tick_params(axis='y', labelcolor='r')
-    ax2.tick_params(axis='y', labelcolor='b')
-    axes[1, 0].set_title('Collateral & Liquidity')
-    axes[1, 0].grid(True, alpha=0.3)
-    
-    # Demand
-    axes[1, 1].plot(results.time, results.demand, 'm-', linewidth=2)
-    axes[1, 1].set_xlabel('Time')
-    axes[1, 1].set_ylabel('Demand')
-    axes[1, 1].set_title('Aggregate Demand')
-    axes[1, 1].grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    
-    if save_path:
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(save_path), exist_ok=True)
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        print(f"Plot saved to {save_path}")
+    ResultsPlotter().plot(results, save_path)
     
     # plt.show()  # specific for non-interactive environments
 
@@ -1,9 +1,13 @@
 import numpy as np
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
 from typing import List
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from model._numba import NUMBA_AVAILABLE
+from model.dynamics import _CELL_FIELDS, _run_mc_kernel, simulate_step_batch
 from model.parameters import SystemParameters
-from .collateral_shock import run_collateral_shock_experiment
-import itertools
 
 @dataclass
 class MonteCarloResults:
@@ -13,6 +17,70 @@ class MonteCarloResults:
     mean_time_to_collapse: np.ndarray
     mean_max_drawdown: np.ndarray
 
+def _evaluate_cell(cell, shock_mags, shock_times, base_params, n_steps):
+    """
+    Run all trials of one grid cell in lockstep with ``simulate_step_batch``.
+    
+    Top-level so it can be shipped to worker processes. Returns the
+    cell's collapse count, time-to-collapse sum and max-drawdown sum.
+    """
+    test_params = replace(base_params, **dict(zip(_CELL_FIELDS, cell)))
+    n_trials = len(shock_mags)
+    
+    S = np.full(n_trials, test_params.initial_supply)
+    P = np.full(n_trials, test_params.initial_price)
+    C = np.full(n_trials, test_params.initial_collateral)
+    L = np.full(n_trials, test_params.initial_liquidity)
+    D = np.full(n_trials, test_params.initial_demand)
+    
+    collapse_idx = np.full(n_trials, -1)
+    max_drawdown = np.full(n_trials, -np.inf)
+    c_shock = np.empty(n_trials)
+    
+    for t in range(n_steps):
+        np.maximum(max_drawdown, 1.0 - P, out=max_drawdown)
+        collapse_idx[(collapse_idx < 0) & (P < test_params.collapse_price_threshold)] = t
+        
+        np.multiply(shock_mags, shock_times == t, out=c_shock)
+        S, P, C, L, D = simulate_step_batch(
+            S, P, C, L, D, test_params, collateral_shock=c_shock
+        )
+    
+    collapsed = collapse_idx >= 0
+    return (
+        np.count_nonzero(collapsed),
+        np.sum(collapse_idx[collapsed] * test_params.dt),
+        np.sum(max_drawdown)
+    )
+
+def _run_mc_batched(cells, shock_mags, shock_times, base_params, n_steps):
+    """
+    NumPy fallback for ``_run_mc_kernel`` when Numba is not installed.
+    
+    Cells are independent, so large grids are spread over worker processes
+    with ``_evaluate_cell``; small grids run serially in this process.
+    """
+    total_cells = cells.shape[0]
+    n_workers = os.cpu_count() or 1
+    args = (
+        cells,
+        shock_mags,
+        shock_times,
+        itertools.repeat(base_params),
+        itertools.repeat(n_steps),
+    )
+    
+    if n_workers == 1 or total_cells < 4 * n_workers:
+        outputs = list(map(_evaluate_cell, *args))
+    else:
+        # 'spawn' so workers never inherit a forked, multithreaded interpreter
+        chunksize = max(1, total_cells // (4 * n_workers))
+        with ProcessPoolExecutor(mp_context=get_context('spawn')) as executor:
+            outputs = list(executor.map(_evaluate_cell, *args, chunksize=chunksize))
+    
+    collapses, ttc_sum, drawdown_sum = (np.array(column, dtype=np.float64) for column in zip(*outputs))
+    return collapses, ttc_sum, drawdown_sum
+
 def run_monte_carlo_stress_test(
     param_ranges: dict,
     n_trials: int,
@@ -38,60 +106,41 @@ def run_monte_carlo_stress_test(
         for name, (min_val, max_val) in param_ranges.items()
     }
     
-    # Initialize result arrays
+    # Flatten the grid into one row of kernel inputs per cell
     n_params = len(param_ranges)
-    collapse_prob = np.zeros([grid_size] * n_params)
-    mean_ttc = np.zeros([grid_size] * n_params)
-    mean_drawdown = np.zeros([grid_size] * n_params)
-    
-    # Grid search
     param_names = list(param_ranges.keys())
+    for name in param_names:
+        if not hasattr(base_params, name):
+            raise ValueError(f"Unknown parameter: {name}")
     
-    for indices in itertools.product(*[range(grid_size)] * n_params):
-        # Set parameters
-        test_params = SystemParameters()
-        # Copy base params first might be safer if we added a copy method, 
-        # but here we just instantiate new and overwrite
-        
-        # Actually better to copy base_params or set all fields. 
-        # For now assuming defaults in SystemParameters are 'base' or close enough, 
-        # but let's copy fields from base_params if we can.
-        # Since SystemParameters is a dataclass...
-        from dataclasses import asdict
-        test_params = SystemParameters(**asdict(base_params))
-        
-        for i, param_name in enumerate(param_names):
-            setattr(test_params, param_name, param_values[param_name][indices[i]])
-        
-        # Run trials
-        collapses = 0
-        ttc_sum = 0
-        drawdown_sum = 0
-        
-        for trial in range(n_trials):
-            # Randomize shock
-            shock_mag = np.random.uniform(-0.5, -0.2)
-            shock_time = np.random.randint(50, 150)
-            
-            test_params.random_seed = base_params.random_seed + trial
-            
-            result = run_collateral_shock_experiment(
-                shock_magnitude=shock_mag,
-                shock_time=shock_time,
-                params=test_params,
-                n_steps=n_steps
-            )
-            
-            if result.time_to_collapse < np.inf:
-                collapses += 1
-                ttc_sum += result.time_to_collapse
-            
-            drawdown_sum += result.max_drawdown
-        
-        # Store results
-        collapse_prob[indices] = collapses / n_trials
-        mean_ttc[indices] = ttc_sum / max(collapses, 1)
-        mean_drawdown[indices] = drawdown_sum / n_trials
+    total_cells = grid_size ** n_params
+    base_row = [float(getattr(base_params, field)) for field in _CELL_FIELDS]
+    cells = np.tile(np.array(base_row, dtype=np.float64), (total_cells, 1))
+    
+    axes = np.meshgrid(*[param_values[name] for name in param_names], indexing='ij')
+    for name, values in zip(param_names, axes):
+        if name in _CELL_FIELDS:
+            cells[:, _CELL_FIELDS.index(name)] = values.ravel()
+    
+    # Randomize shocks for every trial of every cell up front
+    rng = np.random.default_rng(base_params.random_seed)
+    shock_mags = rng.uniform(-0.5, -0.2, size=(total_cells, n_trials))
+    shock_times = rng.integers(50, 150, size=(total_cells, n_trials))
+    
+    # Run all cells in parallel
+    if NUMBA_AVAILABLE:
+        collapses, ttc_sum, drawdown_sum = _run_mc_kernel(
+            cells, shock_mags, shock_times, n_steps
+        )
+    else:
+        collapses, ttc_sum, drawdown_sum = _run_mc_batched(
+            cells, shock_mags, shock_times, base_params, n_steps
+        )
+    
+    shape = [grid_size] * n_params
+    collapse_prob = (collapses / n_trials).reshape(shape)
+    mean_ttc = (ttc_sum / np.maximum(collapses, 1)).reshape(shape)
+    mean_drawdown = (drawdown_sum / n_trials).reshape(shape)
     
     return MonteCarloResults(
         collapse_probabilities=collapse_prob,
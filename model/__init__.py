@@ -14,6 +14,8 @@ from .dynamics import (
     update_liquidity,
     update_demand,
     simulate_step,
+    simulate_step_batch,
+    simulate_trajectory,
 )
 from .market import (
     arbitrage_opportunity,
@@ -30,6 +32,8 @@ __all__ = [
     "update_liquidity",
     "update_demand",
     "simulate_step",
+    "simulate_step_batch",
+    "simulate_trajectory",
     # Market
     "arbitrage_opportunity",
     "reflexivity_coefficient",
@@ -0,0 +1,25 @@
+"""
+Optional Numba support.
+
+The compiled kernels in this package are written in the subset of Python
+accepted by Numba's nopython mode. When Numba is not installed the
+decorators below degrade to no-ops and the kernels run as plain Python,
+so results agree up to floating-point rounding (only slower).
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for ``numba.njit``."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
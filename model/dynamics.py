@@ -1,7 +1,19 @@
+import math
 import numpy as np
 from typing import Tuple
+from ._numba import njit, prange
 from .parameters import SystemParameters
 
+# LLVM fast-math flags for the compiled kernels below. Only 'nsz' (no
+# signed zeros: x + 0.0 may be folded to x) is enabled; it lets LLVM drop
+# the zero-shock additions without changing any result. Reassociation,
+# FMA contraction and reciprocal approximation are left out because the
+# dynamics are chaotic after a collapse, where they shift peg_deviation by
+# up to ~2.6%. Defined here rather than in _numba.py so that Numba's
+# on-disk cache, which is keyed on this file, is invalidated when the
+# flags change.
+FASTMATH = {'nsz'}
+
 def update_supply(
     S: float,
     P: float,
@@ -103,15 +115,18 @@ def update_liquidity(
     params: SystemParameters
 ) -> float:
     """Liquidity FLEES crisis."""
+    initial_liquidity = params.initial_liquidity
     collateral_ratio = C / S if S > 0 else 1.0
 
+    deviation = abs(P - 1.0)
+
     # Base flow (positive when stable)
-    stability = 1.0 - abs(P - 1.0)
+    stability = 1.0 - deviation
     base_flow = 0.02 * stability
 
     # Instability penalty
-    if abs(P - 1.0) > 0.05:
-        instability_penalty = -0.15 * abs(P - 1.0)
+    if deviation > 0.05:
+        instability_penalty = -0.15 * deviation
     else:
         instability_penalty = 0.0
 
@@ -122,7 +137,7 @@ def update_liquidity(
         cr_penalty = 0.0
 
     # Bank run dynamics
-    liquidity_ratio = L / params.initial_liquidity
+    liquidity_ratio = L / initial_liquidity
     if liquidity_ratio < 0.5:
         bank_run_penalty = -0.25 * (0.5 - liquidity_ratio)
     else:
@@ -130,7 +145,7 @@ def update_liquidity(
 
     total_flow = base_flow + instability_penalty + cr_penalty + bank_run_penalty
     L_new = L * (1.0 + total_flow)
-    return max(L_new, params.initial_liquidity * 0.01)
+    return max(L_new, initial_liquidity * 0.01)
 
 
 def update_demand(
@@ -142,8 +157,9 @@ def update_demand(
     params: SystemParameters
 ) -> float:
     """Demand with panic tipping points."""
+    initial_liquidity = params.initial_liquidity
     collateral_ratio = C / S if S > 0 else 1.0
-    liquidity_ratio = L / params.initial_liquidity if params.initial_liquidity > 0 else 1.0
+    liquidity_ratio = L / initial_liquidity if initial_liquidity > 0 else 1.0
 
     # Normal elasticity
     price_effect = -params.demand_elasticity * (P - 1.0)
@@ -190,3 +206,426 @@ def simulate_step(
     P_new = update_price(S_new, D_new, L_new, C_new, params)
 
     return (S_new, P_new, C_new, L_new, D_new)
+
+
+def simulate_step_batch(
+    S: np.ndarray,
+    P: np.ndarray,
+    C: np.ndarray,
+    L: np.ndarray,
+    D: np.ndarray,
+    params: SystemParameters,
+    collateral_shock=0.0,
+    liquidity_shock=0.0
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized ``simulate_step`` over a batch of independent trajectories.
+
+    Each state argument is an array of shape (n,); shocks may be scalars or
+    arrays of the same shape. Branches become ``np.where`` selects so all
+    trajectories advance in a single call.
+    """
+    initial_liquidity = params.initial_liquidity
+    initial_demand = params.initial_demand
+
+    # Collateral
+    C_new = C * (1.0 + collateral_shock)
+    depeg_severity = np.maximum(0.9 - P, 0.0) / 0.9
+    C_new = np.where(P < 0.9, C_new * (1.0 - depeg_severity * 0.2), C_new)
+    C_new = np.maximum(C_new, 0.0)
+
+    collateral_ratio = np.divide(C_new, S, out=np.ones_like(S), where=S > 0)
+    deviation = np.abs(P - 1.0)
+
+    # Liquidity
+    base_flow = 0.02 * (1.0 - deviation)
+    # Piecewise terms as clamps and masked products rather than selects
+    instability_penalty = -0.15 * deviation * (deviation > 0.05)
+    deficit = np.maximum(1.0 - collateral_ratio, 0.0)
+    cr_penalty = -0.2 * deficit
+    liquidity_ratio = L / initial_liquidity
+    bank_run_penalty = -0.25 * np.maximum(0.5 - liquidity_ratio, 0.0)
+    total_flow = base_flow + instability_penalty + cr_penalty + bank_run_penalty
+    L_new = np.maximum(L * (1.0 + total_flow), initial_liquidity * 0.01)
+    L_new = L_new * (1.0 + liquidity_shock)
+
+    # Demand (L_new's ratio to its initial level feeds every block below)
+    new_liquidity_ratio = L_new / initial_liquidity
+    if initial_liquidity > 0:
+        liquidity_ratio = new_liquidity_ratio
+    else:
+        liquidity_ratio = np.ones_like(L_new)
+    price_effect = -params.demand_elasticity * (P - 1.0)
+    price_panic = np.maximum(0.9 - P, 0.0) / 0.9
+    liquidity_panic = np.maximum(0.3 - liquidity_ratio, 0.0) / 0.3
+    panic_factor = -0.5 * deficit ** 1.5
+    panic_factor -= 0.3 * (collateral_ratio < 0.7)
+    panic_factor -= 0.4 * price_panic ** 1.5
+    panic_factor -= 0.25 * (P < 0.7)
+    panic_factor -= 0.5 * liquidity_panic
+    D_new = np.maximum(D + (price_effect + panic_factor) * D, initial_demand * 0.01)
+
+    # Supply
+    price_deviation = P - 1.0
+    delta_mint = np.minimum(params.mint_coefficient * price_deviation * S, L_new * 0.1)
+    effectiveness = np.where(collateral_ratio < 1.0, np.maximum(collateral_ratio ** 2, 0.01), 1.0)
+    effectiveness = np.where(P < 0.8, effectiveness * (P / 0.8) ** 2, effectiveness)
+    effectiveness = effectiveness * np.minimum(new_liquidity_ratio, 1.0)
+    delta_burn = params.burn_coefficient * np.abs(price_deviation) * S * effectiveness
+    delta_burn = np.minimum(delta_burn, S * 0.1)
+    S_new = np.where(price_deviation > 0, S + delta_mint, S - delta_burn)
+
+    # Price
+    solvent = S_new > 0
+    base_price = np.divide(D_new, S_new, out=np.ones_like(S_new), where=solvent)
+    collateral_ratio = np.divide(C_new, S_new, out=np.ones_like(S_new), where=solvent)
+    panic_awareness = np.maximum(1.0 - collateral_ratio, 0.0) ** 1.5
+    price = np.where(
+        collateral_ratio < 1.0,
+        base_price * (1 - panic_awareness) + collateral_ratio * panic_awareness,
+        base_price
+    )
+    price = np.where(
+        new_liquidity_ratio < 0.5, price * (new_liquidity_ratio / 0.5) ** 2, price
+    )
+    P_new = np.where(solvent, np.maximum(price, 0.001), 1.0)
+
+    return (S_new, P_new, C_new, L_new, D_new)
+
+
+@njit(inline='always', fastmath=FASTMATH)
+def _step(
+    S,
+    P,
+    C,
+    L,
+    D,
+    collateral_shock,
+    liquidity_shock,
+    mint_coeff,
+    burn_coeff,
+    demand_elasticity,
+    initial_liquidity,
+    initial_demand,
+):
+    """
+    Fused, inlined body of ``simulate_step`` for the compiled kernels.
+
+    Call sites that pass literal zero shocks get the shock multiplies
+    constant-folded away.
+    """
+    # Collateral
+    C_new = C * (1.0 + collateral_shock)
+    if P < 0.9:
+        depeg_severity = (0.9 - P) / 0.9
+        C_new *= (1.0 - depeg_severity * 0.2)
+    C_new = C_new if C_new > 0.0 else 0.0
+
+    collateral_ratio = C_new / S if S > 0 else 1.0
+    deviation = math.fabs(P - 1.0)
+
+    # Liquidity
+    base_flow = 0.02 * (1.0 - deviation)
+    instability_penalty = -0.15 * deviation if deviation > 0.05 else 0.0
+    cr_penalty = -0.2 * (1.0 - collateral_ratio) if collateral_ratio < 1.0 else 0.0
+    liquidity_ratio = L / initial_liquidity
+    bank_run_penalty = -0.25 * (0.5 - liquidity_ratio) if liquidity_ratio < 0.5 else 0.0
+    total_flow = base_flow + instability_penalty + cr_penalty + bank_run_penalty
+    L_new = L * (1.0 + total_flow)
+    L_floor = initial_liquidity * 0.01
+    L_new = L_new if L_new > L_floor else L_floor
+    L_new = L_new * (1.0 + liquidity_shock)
+
+    # Demand (L_new's ratio to its initial level feeds every block below)
+    new_liquidity_ratio = L_new / initial_liquidity
+    liquidity_ratio = new_liquidity_ratio if initial_liquidity > 0 else 1.0
+    price_effect = -demand_elasticity * (P - 1.0)
+    panic_factor = 0.0
+    if collateral_ratio < 1.0:
+        deficit = 1.0 - collateral_ratio
+        panic_factor -= 0.5 * deficit ** 1.5
+        if collateral_ratio < 0.7:
+            panic_factor -= 0.3
+    if P < 0.9:
+        price_panic = (0.9 - P) / 0.9
+        panic_factor -= 0.4 * price_panic ** 1.5
+        if P < 0.7:
+            panic_factor -= 0.25
+    if liquidity_ratio < 0.3:
+        liquidity_panic = (0.3 - liquidity_ratio) / 0.3
+        panic_factor -= 0.5 * liquidity_panic
+    D_new = D + (price_effect + panic_factor) * D
+    D_floor = initial_demand * 0.01
+    D_new = D_new if D_new > D_floor else D_floor
+
+    # Supply
+    price_deviation = P - 1.0
+    if price_deviation > 0:
+        delta_mint = mint_coeff * price_deviation * S
+        mint_cap = L_new * 0.1
+        S_new = S + (delta_mint if delta_mint < mint_cap else mint_cap)
+    else:
+        delta_burn = burn_coeff * math.fabs(price_deviation) * S
+        if collateral_ratio < 1.0:
+            effectiveness = collateral_ratio ** 2
+            effectiveness = effectiveness if effectiveness > 0.01 else 0.01
+        else:
+            effectiveness = 1.0
+        if P < 0.8:
+            effectiveness *= (P / 0.8) ** 2
+        effectiveness *= new_liquidity_ratio if new_liquidity_ratio < 1.0 else 1.0
+        delta_burn *= effectiveness
+        burn_cap = S * 0.1
+        S_new = S - (delta_burn if delta_burn < burn_cap else burn_cap)
+
+    # Price
+    if S_new <= 0:
+        P_new = 1.0
+    else:
+        base_price = D_new / S_new
+        collateral_ratio = C_new / S_new
+        if collateral_ratio < 1.0:
+            panic_awareness = (1.0 - collateral_ratio) ** 1.5
+            P_new = base_price * (1 - panic_awareness) + collateral_ratio * panic_awareness
+        else:
+            P_new = base_price
+        if new_liquidity_ratio < 0.5:
+            P_new *= (new_liquidity_ratio / 0.5) ** 2
+        P_new = P_new if P_new > 0.001 else 0.001
+
+    return S_new, P_new, C_new, L_new, D_new
+
+
+@njit(inline='always')
+def _record(trajectory, t, S, P, C, L, D, store_full, dt, collapse_thr, recovery_thr, metrics):
+    """
+    Store step ``t`` and update the running metrics.
+
+    ``metrics`` is (peg_deviation, prev_abs_deviation, collapse_idx,
+    max_drawdown, recovered), accumulated from the float64 state regardless
+    of the float32 storage.
+    """
+    peg_deviation, prev_abs, collapse_idx, max_drawdown, recovered = metrics
+    if store_full:
+        trajectory[t, 0] = S
+        trajectory[t, 1] = P
+        trajectory[t, 2] = C
+        trajectory[t, 3] = L
+        trajectory[t, 4] = D
+    cur_abs = math.fabs(P - 1.0)
+    if t > 0:
+        peg_deviation += 0.5 * (prev_abs + cur_abs) * dt
+    if 1.0 - P > max_drawdown:
+        max_drawdown = 1.0 - P
+    if collapse_idx < 0:
+        if P < collapse_thr:
+            collapse_idx = t
+    elif P > recovery_thr:
+        recovered = True
+    return peg_deviation, cur_abs, collapse_idx, max_drawdown, recovered
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def _simulate_trajectory(
+    trajectory,
+    n_steps,
+    shock_time,
+    collateral_shock,
+    liquidity_shock,
+    S0,
+    P0,
+    C0,
+    L0,
+    D0,
+    mint_coeff,
+    burn_coeff,
+    demand_elasticity,
+    initial_liquidity,
+    initial_demand,
+    dt,
+    collapse_thr,
+    recovery_thr,
+):
+    """
+    Compiled equivalent of iterating ``simulate_step`` for ``n_steps``.
+
+    The ``update_*`` bodies are inlined so the whole trajectory runs in a
+    single call with no per-step Python overhead. Shocks are applied on
+    step ``shock_time``; the steps before and after it run a shock-free
+    specialization of the step.
+
+    The state (S, P, C, L, D) at the start of each step is written into
+    the caller's float32 ``trajectory`` buffer of shape (n_steps, 5); pass
+    a (0, 5) buffer to skip storage, so metrics-only callers can reuse one
+    buffer across runs.
+
+    Returns (peg_deviation, collapse_idx, max_drawdown, recovered), tracked
+    in float64 while stepping: the trapezoidal integral of |P - 1| over
+    time, the first step with price below ``collapse_thr`` (-1 if none),
+    the maximum drawdown, and whether the price rose back above
+    ``recovery_thr`` after collapsing (True if it never collapsed).
+    """
+    store_full = trajectory.shape[0] > 0
+    metrics = (0.0, 0.0, -1, -np.inf, False)
+
+    S = S0
+    P = P0
+    C = C0
+    L = L0
+    D = D0
+
+    # Steps outside [0, n_steps) never apply the shock
+    shock_step = shock_time if 0 <= shock_time < n_steps else n_steps
+
+    for t in range(shock_step):
+        metrics = _record(
+            trajectory, t, S, P, C, L, D, store_full, dt, collapse_thr, recovery_thr, metrics
+        )
+        S, P, C, L, D = _step(
+            S, P, C, L, D, 0.0, 0.0,
+            mint_coeff, burn_coeff, demand_elasticity, initial_liquidity, initial_demand
+        )
+
+    if shock_step < n_steps:
+        metrics = _record(
+            trajectory, shock_step, S, P, C, L, D, store_full, dt, collapse_thr, recovery_thr, metrics
+        )
+        S, P, C, L, D = _step(
+            S, P, C, L, D, collateral_shock, liquidity_shock,
+            mint_coeff, burn_coeff, demand_elasticity, initial_liquidity, initial_demand
+        )
+
+    for t in range(shock_step + 1, n_steps):
+        metrics = _record(
+            trajectory, t, S, P, C, L, D, store_full, dt, collapse_thr, recovery_thr, metrics
+        )
+        S, P, C, L, D = _step(
+            S, P, C, L, D, 0.0, 0.0,
+            mint_coeff, burn_coeff, demand_elasticity, initial_liquidity, initial_demand
+        )
+
+    peg_deviation, _, collapse_idx, max_drawdown, recovered = metrics
+    return peg_deviation, collapse_idx, max_drawdown, recovered or collapse_idx < 0
+
+
+# SystemParameters fields consumed by _run_mc_kernel, in column order
+_CELL_FIELDS = (
+    "initial_supply",
+    "initial_price",
+    "initial_collateral",
+    "initial_liquidity",
+    "initial_demand",
+    "mint_coefficient",
+    "burn_coefficient",
+    "demand_elasticity",
+    "dt",
+    "collapse_price_threshold",
+)
+
+
+@njit(parallel=True, cache=True, fastmath=FASTMATH)
+def _run_mc_kernel(cells, shock_mags, shock_times, n_steps):
+    """
+    Evaluate every grid cell (one row of ``cells``) over its trial shocks.
+
+    ``shock_mags`` and ``shock_times`` have shape (total_cells, n_trials).
+    Returns per-cell collapse counts, time-to-collapse sums over collapsed
+    trials and max-drawdown sums.
+    """
+    total_cells = cells.shape[0]
+    n_trials = shock_mags.shape[1]
+    collapses = np.zeros(total_cells)
+    ttc_sum = np.zeros(total_cells)
+    drawdown_sum = np.zeros(total_cells)
+    # Metrics only: one empty buffer shared by every trial
+    no_storage = np.empty((0, 5), dtype=np.float32)
+
+    for c in prange(total_cells):
+        S0 = cells[c, 0]
+        P0 = cells[c, 1]
+        C0 = cells[c, 2]
+        L0 = cells[c, 3]
+        D0 = cells[c, 4]
+        mint_coeff = cells[c, 5]
+        burn_coeff = cells[c, 6]
+        demand_elasticity = cells[c, 7]
+        dt = cells[c, 8]
+        collapse_thr = cells[c, 9]
+
+        for trial in range(n_trials):
+            _, collapse_idx, max_drawdown, _ = _simulate_trajectory(
+                no_storage, n_steps, shock_times[c, trial], shock_mags[c, trial], 0.0,
+                S0, P0, C0, L0, D0,
+                mint_coeff, burn_coeff, demand_elasticity, L0, D0,
+                dt, collapse_thr, np.inf
+            )
+
+            if collapse_idx >= 0:
+                collapses[c] += 1
+                ttc_sum[c] += collapse_idx * dt
+            drawdown_sum[c] += max_drawdown
+
+    return collapses, ttc_sum, drawdown_sum
+
+
+def _run_trajectory(
+    params: SystemParameters,
+    n_steps: int,
+    shock_time: int = -1,
+    collateral_shock: float = 0.0,
+    liquidity_shock: float = 0.0,
+):
+    """
+    Unpack ``params`` and run ``_simulate_trajectory`` into a new buffer.
+
+    Returns (trajectory, peg_deviation, collapse_idx, max_drawdown, recovered).
+    """
+    trajectory = np.empty((n_steps, 5), dtype=np.float32)
+    metrics = _simulate_trajectory(
+        trajectory,
+        int(n_steps),
+        int(shock_time),
+        float(collateral_shock),
+        float(liquidity_shock),
+        float(params.initial_supply),
+        float(params.initial_price),
+        float(params.initial_collateral),
+        float(params.initial_liquidity),
+        float(params.initial_demand),
+        float(params.mint_coefficient),
+        float(params.burn_coefficient),
+        float(params.demand_elasticity),
+        float(params.initial_liquidity),
+        float(params.initial_demand),
+        float(params.dt),
+        float(params.collapse_price_threshold),
+        float(params.recovery_price_threshold),
+    )
+    return (trajectory,) + metrics
+
+
+def simulate_trajectory(
+    params: SystemParameters,
+    n_steps: int,
+    shock_time: int = -1,
+    collateral_shock: float = 0.0,
+    liquidity_shock: float = 0.0
+) -> np.ndarray:
+    """
+    Simulate a full trajectory from the initial conditions in ``params``.
+
+    Args:
+        params: System parameters
+        n_steps: Total simulation steps
+        shock_time: Time step when the shocks are applied (-1 for none)
+        collateral_shock: Percentage collateral shock at ``shock_time``
+        liquidity_shock: Percentage liquidity shock at ``shock_time``
+
+    Returns:
+        float32 array of shape (n_steps, 5) whose columns are the supply,
+        price, collateral, liquidity and demand time series
+    """
+    trajectory, _, _, _, _ = _run_trajectory(
+        params, n_steps, shock_time, collateral_shock, liquidity_shock
+    )
+    return trajectory
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SystemParameters:
     """Core parameters for stablecoin dynamics."""
     
@@ -2,13 +2,18 @@ import pytest
 import numpy as np
 from model.dynamics import (
     update_supply, update_price, update_collateral,
-    update_liquidity, update_demand, simulate_step
+    update_liquidity, update_demand, simulate_step,
+    simulate_step_batch, simulate_trajectory
 )
 from model.parameters import SystemParameters
 
-def test_supply_increases_when_price_above_peg():
+@pytest.fixture(scope="module")
+def params():
+    """Default parameters, shared since SystemParameters is immutable."""
+    return SystemParameters()
+
+def test_supply_increases_when_price_above_peg(params):
     """Supply should increase when P > 1."""
-    params = SystemParameters()
     S_initial = 1e6
     P = 1.1
     L = 1e6
@@ -17,9 +22,8 @@ def test_supply_increases_when_price_above_peg():
     S_new = update_supply(S_initial, P, L, C, params)
     assert S_new > S_initial
 
-def test_supply_decreases_when_price_below_peg():
+def test_supply_decreases_when_price_below_peg(params):
     """Supply should decrease when P < 1 (if mechanism works)."""
-    params = SystemParameters()
     S_initial = 1e6
     P = 0.95  # Mild depeg (mechanism still works)
     L = 1e6
@@ -28,9 +32,8 @@ def test_supply_decreases_when_price_below_peg():
     S_new = update_supply(S_initial, P, L, C, params)
     assert S_new < S_initial
 
-def test_burn_mechanism_fails_under_stress():
+def test_burn_mechanism_fails_under_stress(params):
     """Burn mechanism should be ineffective when CR is low."""
-    params = SystemParameters()
     S_initial = 1e6
     P = 0.7  # Significant depeg
     L = 1e6
@@ -42,19 +45,15 @@ def test_burn_mechanism_fails_under_stress():
     actual_burn = S_initial - S_new
     assert actual_burn < normal_burn * 0.5  # Less than 50% of normal
 
-def test_price_reflects_supply_demand():
+def test_price_reflects_supply_demand(params):
     """Price should reflect supply-demand ratio."""
-    params = SystemParameters()
-
     P1 = update_price(S=1e6, D=2e6, L=1e6, C=1.5e6, params=params)
     P2 = update_price(S=2e6, D=1e6, L=1e6, C=3e6, params=params)
 
     assert P1 > P2
 
-def test_price_capped_by_collateral_ratio():
+def test_price_capped_by_collateral_ratio(params):
     """Price should be pulled toward CR when undercollateralized."""
-    params = SystemParameters()
-    
     # Severely undercollateralized: CR = 0.5
     P = update_price(S=1e6, D=1e6, L=1e6, C=0.5e6, params=params)
     
@@ -82,9 +81,8 @@ def test_collateral_reflexive_crash():
     # Should crash due to reflexivity
     assert C_new < C_initial
 
-def test_liquidity_flees_instability():
+def test_liquidity_flees_instability(params):
     """Liquidity should decrease when price is unstable."""
-    params = SystemParameters()
     L_initial = params.initial_liquidity
     P = 0.8  # Significant depeg
     S = 1e6
@@ -93,9 +91,8 @@ def test_liquidity_flees_instability():
     L_new = update_liquidity(L_initial, P, S, C, params)
     assert L_new < L_initial
 
-def test_demand_panics_at_low_cr():
+def test_demand_panics_at_low_cr(params):
     """Demand should crash when collateral ratio drops."""
-    params = SystemParameters()
     D_initial = params.initial_demand
     P = 0.9
     S = 1e6
@@ -106,17 +103,15 @@ def test_demand_panics_at_low_cr():
     # Should see significant panic-driven demand destruction
     assert D_new < D_initial * 0.8
 
-def test_simulate_step_maintains_positive_values():
+def test_simulate_step_maintains_positive_values(params):
     """All state variables should remain positive."""
-    params = SystemParameters()
     state = (1e6, 1.0, 1.5e6, 1e6, 1e6)
 
     new_state = simulate_step(state, params)
-    assert all(x > 0 for x in new_state)
+    assert min(new_state) > 0
 
-def test_death_spiral_occurs():
+def test_death_spiral_occurs(params):
     """System should collapse under severe shock."""
-    params = SystemParameters()
     state = (1e6, 1.0, 1.5e6, 1e6, 1e6)  # S, P, C, L, D
     
     # Apply severe collateral shock
@@ -129,3 +124,49 @@ def test_death_spiral_occurs():
     S, P, C, L, D = state
     # Price should have collapsed significantly
     assert P < 0.5, f"Expected collapse, but P={P:.3f}"
+
+@pytest.mark.parametrize("shock_time", [0, 50, 299, -1, 300])
+@pytest.mark.parametrize("collateral_shock,liquidity_shock", [(-0.5, 0.0), (0.0, -0.8)])
+def test_trajectory_matches_simulate_step(shock_time, collateral_shock, liquidity_shock, params):
+    """Compiled trajectory should reproduce the step-by-step simulation."""
+    n_steps = 300
+
+    trajectory = simulate_trajectory(
+        params, n_steps, shock_time=shock_time,
+        collateral_shock=collateral_shock, liquidity_shock=liquidity_shock
+    )
+    assert trajectory.shape == (n_steps, 5)
+
+    state = (
+        params.initial_supply, params.initial_price, params.initial_collateral,
+        params.initial_liquidity, params.initial_demand
+    )
+    for t in range(n_steps):
+        # Trajectories are stored in float32
+        assert np.allclose(trajectory[t], state, rtol=1e-6)
+        shocked = t == shock_time
+        state = simulate_step(
+            state, params,
+            collateral_shock=collateral_shock if shocked else 0.0,
+            liquidity_shock=liquidity_shock if shocked else 0.0
+        )
+
+def test_batch_step_matches_scalar_step(params):
+    """Vectorized step should agree with simulate_step for every trajectory."""
+    states = [
+        (1e6, 1.0, 1.5e6, 1e6, 1e6),
+        (1e6, 1.1, 1.5e6, 1e6, 1e6),
+        (1e6, 0.75, 0.6e6, 0.4e6, 0.8e6),
+        (1e6, 0.4, 0.3e6, 0.2e6, 0.3e6),
+    ]
+    shocks = np.array([0.0, -0.3, 0.0, -0.5])
+
+    batch = simulate_step_batch(
+        *(np.array(column) for column in zip(*states)),
+        params,
+        collateral_shock=shocks
+    )
+
+    for i, state in enumerate(states):
+        expected = simulate_step(state, params, collateral_shock=shocks[i])
+        assert np.allclose([column[i] for column in batch], expected, rtol=1e-12)
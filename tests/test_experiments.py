@@ -0,0 +1,103 @@
+import pytest
+import numpy as np
+from experiments.collateral_shock import STATE_DTYPE, run_collateral_shock_experiment
+from experiments.monte_carlo import (
+    _evaluate_cell, _run_mc_kernel, run_monte_carlo_stress_test
+)
+from model.dynamics import simulate_step, simulate_trajectory
+from model.parameters import SystemParameters
+
+def _reference_price(params, n_steps, shock_time, collateral_shock):
+    """Float64 price series from the scalar ``simulate_step`` loop."""
+    state = (
+        params.initial_supply, params.initial_price, params.initial_collateral,
+        params.initial_liquidity, params.initial_demand
+    )
+    price = np.empty(n_steps)
+    for t in range(n_steps):
+        price[t] = state[1]
+        shock = collateral_shock if t == shock_time else 0.0
+        state = simulate_step(state, params, collateral_shock=shock)
+    return price
+
+@pytest.mark.parametrize("elasticity,shock", [(0.5, -0.3), (3.0, -0.5), (5.0, -0.5)])
+def test_metrics_match_reference_formulas(elasticity, shock):
+    """In-kernel metrics should agree with the NumPy formulas on float64 prices."""
+    params = SystemParameters(demand_elasticity=elasticity)
+    n_steps = 300
+    results = run_collateral_shock_experiment(shock, 100, params, n_steps=n_steps)
+
+    price = _reference_price(params, n_steps, 100, shock)
+    time = np.arange(n_steps) * params.dt
+    collapsed = np.where(price < params.collapse_price_threshold)[0]
+
+    assert np.isclose(
+        results.peg_deviation_integral,
+        np.trapezoid(np.abs(price - 1.0), time),
+        rtol=1e-9
+    )
+    assert np.isclose(results.max_drawdown, np.max(1.0 - price), rtol=1e-12)
+    if len(collapsed) > 0:
+        assert results.time_to_collapse == time[collapsed[0]]
+        after = price[collapsed[0]:]
+        assert results.recovered == bool(np.any(after > params.recovery_price_threshold))
+    else:
+        assert results.time_to_collapse == np.inf
+        assert results.recovered
+
+def test_results_expose_zero_copy_state_views():
+    """Time series attributes should be views into one record array."""
+    params = SystemParameters()
+    results = run_collateral_shock_experiment(-0.4, 100, params, n_steps=200)
+
+    assert results.trajectory.dtype == STATE_DTYPE
+    assert results.trajectory.shape == (200,)
+    assert np.shares_memory(results.price, results.trajectory)
+    assert np.shares_memory(results.demand, results.trajectory)
+    expected = simulate_trajectory(params, 200, shock_time=100, collateral_shock=-0.4)
+    assert np.array_equal(results.supply, expected[:, 0])
+    assert np.array_equal(results.demand, expected[:, 4])
+
+def test_monte_carlo_grid_shape_and_determinism():
+    """Monte Carlo sweep should fill the grid and be reproducible."""
+    params = SystemParameters()
+    ranges = {'demand_elasticity': (0.5, 5.0)}
+
+    r1 = run_monte_carlo_stress_test(ranges, n_trials=3, base_params=params, n_steps=200)
+    r2 = run_monte_carlo_stress_test(ranges, n_trials=3, base_params=params, n_steps=200)
+
+    assert r1.collapse_probabilities.shape == (10,)
+    assert np.all((r1.collapse_probabilities >= 0) & (r1.collapse_probabilities <= 1))
+    assert np.array_equal(r1.collapse_probabilities, r2.collapse_probabilities)
+    assert np.array_equal(r1.mean_max_drawdown, r2.mean_max_drawdown)
+
+def test_monte_carlo_rejects_unknown_parameter():
+    """Sweeping a parameter that does not exist should fail loudly."""
+    with pytest.raises(ValueError):
+        run_monte_carlo_stress_test(
+            {'not_a_parameter': (0.0, 1.0)}, n_trials=1,
+            base_params=SystemParameters(), n_steps=10
+        )
+
+def test_monte_carlo_batched_fallback_matches_kernel():
+    """NumPy fallback should reproduce the compiled Monte Carlo kernel."""
+    params = SystemParameters()
+    cells = np.array([
+        [1e6, 1.0, 1.5e6, 1e6, 1e6, 0.1, 0.1, elasticity, 0.1, 0.5]
+        for elasticity in (0.5, 3.0, 5.0)
+    ])
+
+    rng = np.random.default_rng(params.random_seed)
+    shock_mags = rng.uniform(-0.5, -0.2, size=(3, 4))
+    shock_times = rng.integers(50, 150, size=(3, 4))
+
+    expected = _run_mc_kernel(cells, shock_mags, shock_times, 300)
+    # Evaluate cells serially: forking a pool after the parallel kernel ran
+    # is unsafe, and the pool only wraps _evaluate_cell
+    actual = zip(*(
+        _evaluate_cell(cells[c], shock_mags[c], shock_times[c], params, 300)
+        for c in range(len(cells))
+    ))
+
+    for a, b in zip(actual, expected):
+        assert np.allclose(a, b, rtol=1e-9)